@@ -1,178 +1,703 @@
+import ctypes
+import hashlib
+import os
+import shutil
+import stat
+import subprocess
+import tempfile
+from functools import cache
+
+import numpy as np
 import pandas as pd
-import random
-import sys
 
-# Aumentar o limite de recursão para o Merge Sort em dataframes grandes
-# e para a própria DP em casos com muitos itens.
-sys.setrecursionlimit(3000)
+# Extensão Cython opcional (compilar com: python setup.py build_ext --inplace)
+try:
+    import knapsack_cy
+except ImportError:
+    knapsack_cy = None
 
 
-def gerar_dados_colaboradores(num_colaboradores=25):
+def gerar_dados_colaboradores(num_colaboradores=25, semente=None):
     """
-    Cria uma lista de dicionários com dados fictícios de colaboradores.
+    Cria os dados fictícios de colaboradores, organizados por coluna.
+
+    Horas e valores são sorteados de uma só vez pelo gerador do NumPy, em vez
+    de uma chamada a random.randint por colaborador.
+
+    Returns:
+        dict: {"Nome": lista, "Horas_Necessarias": array, "Valor_Estrategico": array}
+    """
+    rng = np.random.default_rng(semente)
+    return {
+        "Nome": [
+            f"Colaborador_{rotulo_colaborador(i)}" for i in range(num_colaboradores)
+        ],
+        "Horas_Necessarias": rng.integers(10, 101, size=num_colaboradores),  # "Peso" do item
+        "Valor_Estrategico": rng.integers(100, 1001, size=num_colaboradores),  # "Valor" do item
+    }
+
+
+def rotulo_colaborador(i):
     """
-    nomes = [f"Colaborador_{chr(65 + i)}" for i in range(num_colaboradores)]
-    dados = []
-    for nome in nomes:
-        dados.append({
-            "Nome": nome,
-            "Horas_Necessarias": random.randint(10, 100),  # "Peso" do item
-            "Valor_Estrategico": random.randint(100, 1000)  # "Valor" do item
-        })
-    return dados
+    Converte 0, 1, ..., 25, 26, ... em "A", "B", ..., "Z", "AA", ...
+    (como as colunas de uma planilha), para nomear mais de 26 colaboradores.
+    """
+    rotulo = ""
+    i += 1
+    while i > 0:
+        i, resto = divmod(i - 1, 26)
+        rotulo = chr(65 + resto) + rotulo
+    return rotulo
 
 
-def criar_dataframe(dados_lista):
+def criar_dataframe(dados):
     """
-    Converte a lista de dados para um DataFrame do Pandas.
+    Converte os dados (uma sequência por coluna) para um DataFrame do Pandas.
     """
-    df = pd.DataFrame(dados_lista)
+    df = pd.DataFrame(dados)
+    # Nomes como categoria: guarda códigos inteiros em vez de objetos string
+    # e torna o filtro por nome (isin) uma busca vetorizada.
+    df["Nome"] = df["Nome"].astype("category")
     return df
 
 
-# --- Estrutura de Ordenação (Merge Sort Recursivo) ---
+# --- Estrutura de Ordenação (Merge Sort Iterativo) ---
+
+# Tamanho dos blocos ordenados por inserção antes das mesclagens
+TAMANHO_BLOCO = 40
+
+
+def ordenar_dataframe(df, coluna_ordenacao):
+    """
+    Ordena um DataFrame pela coluna indicada usando o Merge Sort.
+
+    O DataFrame é convertido uma única vez para uma lista de tuplas; a
+    ordenação trabalha apenas sobre essa lista e o DataFrame é reconstruído
+    no final, evitando criar DataFrames intermediários.
+    """
+    registros = list(df.itertuples(index=False, name=None))
+    chave = df.columns.get_loc(coluna_ordenacao)
+
+    registros_ordenados = merge_sort(registros, chave)
+
+    # Reaplica os tipos originais (ex.: 'Nome' como categoria)
+    return pd.DataFrame(registros_ordenados, columns=df.columns).astype(df.dtypes)
 
-def merge_sort(df, coluna_ordenacao):
+
+def merge_sort(registros, chave):
     """
-    Função principal do Merge Sort, adaptada para ordenar um DataFrame.
-    Esta é uma implementação 'acadêmica' para cumprir o requisito de recursão.
-    Na prática, usaríamos df.sort_values().
+    Merge Sort iterativo (Bottom-Up), aplicado a uma lista de tuplas.
+
+    Em vez de dividir a lista recursivamente, ordena blocos de TAMANHO_BLOCO
+    elementos por inserção e depois mescla blocos vizinhos em passadas
+    lineares da esquerda para a direita, dobrando a largura a cada passada
+    (a mesma ideia do Timsort do CPython). A ordenação é estável.
+    Na prática, usaríamos df.sort_values(kind='mergesort').
+
+    Args:
+        registros (list): Lista de tuplas (uma por linha do DataFrame).
+        chave (int): Posição, dentro da tupla, da coluna de ordenação.
+
+    Returns:
+        list: Nova lista com os registros ordenados.
     """
-    if len(df) <= 1:
-        return df
+    registros = list(registros)
+    n = len(registros)
 
-    meio = len(df) // 2
+    # 1. Ordena cada bloco pequeno por inserção
+    for inicio in range(0, n, TAMANHO_BLOCO):
+        ordenar_por_insercao(registros, inicio, min(inicio + TAMANHO_BLOCO, n), chave)
 
-    # Divisão recursiva
-    metade_esquerda = merge_sort(df.iloc[:meio].copy(), coluna_ordenacao)
-    metade_direita = merge_sort(df.iloc[meio:].copy(), coluna_ordenacao)
+    # 2. Mescla blocos vizinhos, dobrando a largura a cada passada
+    largura = TAMANHO_BLOCO
+    while largura < n:
+        for inicio in range(0, n, 2 * largura):
+            meio = min(inicio + largura, n)
+            fim = min(inicio + 2 * largura, n)
+            if meio < fim:
+                registros[inicio:fim] = merge(
+                    registros[inicio:meio], registros[meio:fim], chave
+                )
+        largura *= 2
 
-    # Conquista (mesclagem)
-    return merge(metade_esquerda, metade_direita, coluna_ordenacao)
+    return registros
 
 
-def merge(esquerda, direita, coluna):
+def ordenar_por_insercao(registros, inicio, fim, chave):
     """
-    Função auxiliar do Merge Sort para mesclar dois DataFrames ordenados.
+    Insertion Sort (estável) do trecho registros[inicio:fim], no próprio lugar.
+    """
+    for i in range(inicio + 1, fim):
+        atual = registros[i]
+        j = i - 1
+        while j >= inicio and registros[j][chave] > atual[chave]:
+            registros[j + 1] = registros[j]
+            j -= 1
+        registros[j + 1] = atual
+
+
+def merge(lista_esq, lista_dir, chave):
+    """
+    Função auxiliar do Merge Sort para mesclar duas listas ordenadas.
     """
     resultado_lista = []
     idx_esq, idx_dir = 0, 0
 
-    # Converte DataFrames para listas de dicionários para iteração eficiente
-    lista_esq = esquerda.to_dict('records')
-    lista_dir = direita.to_dict('records')
+    # Tamanhos calculados uma única vez, fora do laço
+    tam_esq, tam_dir = len(lista_esq), len(lista_dir)
+
+    if tam_esq and tam_dir:
+        # O registro da frente de cada lista e sua chave só são lidos quando
+        # aquela lista avança, e não novamente a cada comparação.
+        atual_esq, atual_dir = lista_esq[0], lista_dir[0]
+        chave_esq, chave_dir = atual_esq[chave], atual_dir[chave]
+
+        while True:
+            if chave_esq <= chave_dir:
+                resultado_lista.append(atual_esq)
+                idx_esq += 1
+                if idx_esq == tam_esq:
+                    break
+                atual_esq = lista_esq[idx_esq]
+                chave_esq = atual_esq[chave]
+            else:
+                resultado_lista.append(atual_dir)
+                idx_dir += 1
+                if idx_dir == tam_dir:
+                    break
+                atual_dir = lista_dir[idx_dir]
+                chave_dir = atual_dir[chave]
+
+    # Adiciona os elementos restantes (no máximo uma das listas tem sobras)
+    resultado_lista.extend(lista_esq[idx_esq:])
+    resultado_lista.extend(lista_dir[idx_dir:])
+
+    return resultado_lista
+
+
+# --- Solução DP (Problema da Mochila) ---
+
+def otimizar_alocacao_formacao(colaboradores, capacidade_total_horas,
+                               metodo="bottom_up"):
+    """
+    Função 'wrapper' (principal) que prepara os dados e chama a DP.
 
-    while idx_esq < len(lista_esq) and idx_dir < len(lista_dir):
-        if lista_esq[idx_esq][coluna] <= lista_dir[idx_dir][coluna]:
-            resultado_lista.append(lista_esq[idx_esq])
-            idx_esq += 1
-        else:
-            resultado_lista.append(lista_dir[idx_dir])
-            idx_dir += 1
+    Args:
+        colaboradores (pd.DataFrame): Dados dos colaboradores.
+        capacidade_total_horas (int): Orçamento total de horas.
+        metodo (str): "bottom_up" (padrão, iterativa com NumPy),
+            "top_down" (recursão + memorização, até ~900 itens),
+            "cython" (bottom-up compilada, requer a extensão knapsack_cy),
+            "numba" (bottom-up compilada em tempo de execução, requer o
+            pacote numba),
+            "dividir_conquistar" (memória O(N + C), para muitos itens) ou
+            "codegen" (código C gerado com a capacidade fixa, requer gcc).
 
-    # Adiciona os elementos restantes
-    while idx_esq < len(lista_esq):
-        resultado_lista.append(lista_esq[idx_esq])
-        idx_esq += 1
+    Retorna (valor_maximo, lista_de_colaboradores_selecionados)
+    """
+    # Extrai as colunas uma única vez como arrays paralelos (Estrutura de
+    # Arrays), sem criar um dicionário por linha; cada método recebe os dados
+    # no formato de que precisa a partir deles.
+    horas = colaboradores["Horas_Necessarias"].to_numpy(np.int64)
+    valores = colaboradores["Valor_Estrategico"].to_numpy(np.int64)
+
+    if metodo == "top_down":
+        # 'memo' armazena os resultados já calculados (Programação Dinâmica)
+        # numa tabela densa: memo[n, capacidade] = valor máximo, ou -1 se o
+        # subproblema ainda não foi calculado.
+        memo = np.full((len(horas) + 1, capacidade_total_horas + 1), -1,
+                       dtype=np.int64)
+
+        # Tuplas de inteiros Python: acesso por posição mais rápido na recursão
+        valor_max, indices = knapsack_memo(
+            tuple(horas.tolist()), tuple(valores.tolist()),
+            capacidade_total_horas, memo
+        )
+
+    elif metodo == "bottom_up":
+        valor_max, indices = knapsack_bottom_up(horas, valores, capacidade_total_horas)
+
+    elif metodo == "cython":
+        if knapsack_cy is None:
+            raise ImportError(
+                "Extensão knapsack_cy não encontrada. "
+                "Compile com: python setup.py build_ext --inplace"
+            )
+
+        # Memoryviews 'int[::1]' exigem arrays int32 contíguos
+        valor_max, indices = knapsack_cy.knapsack(
+            horas.astype(np.int32), valores.astype(np.int32), capacidade_total_horas
+        )
+
+    elif metodo == "numba":
+        knapsack_nb = compilar_knapsack_nb()
 
-    while idx_dir < len(lista_dir):
-        resultado_lista.append(lista_dir[idx_dir])
-        idx_dir += 1
+        valor_max, indices = knapsack_nb(horas, valores, capacidade_total_horas)
+        valor_max, indices = int(valor_max), indices.tolist()
 
-    return pd.DataFrame(resultado_lista)
+    elif metodo == "dividir_conquistar":
+        valor_max, indices = knapsack_dividir_conquistar(
+            horas, valores, capacidade_total_horas
+        )
 
+    elif metodo == "codegen":
+        valor_max, indices = knapsack_codegen(horas, valores, capacidade_total_horas)
 
-# --- Solução DP (Problema da Mochila com Recursão + Memorização) ---
+    else:
+        raise ValueError(f"Método de otimização desconhecido: {metodo!r}")
 
-def otimizar_alocacao_formacao(colaboradores, capacidade_total_horas):
+    nomes_selecionados = colaboradores["Nome"].to_numpy()[indices].tolist()
+    return (valor_max, nomes_selecionados)
+
+
+def knapsack_bottom_up(horas, valores, capacidade):
     """
-    Função 'wrapper' (principal) que inicializa a memorização
-    e chama a função recursiva de DP.
+    Programação Dinâmica Bottom-Up (iterativa) para o Problema da Mochila.
 
-    Retorna (valor_maximo, lista_de_colaboradores_selecionados)
+    Em vez de recursão, preenche uma única linha 'dp' de tamanho
+    capacidade + 1, atualizada item a item com operações vetorizadas do NumPy.
+
+    Os dados usam o menor tipo inteiro que comporta os valores (int16 para
+    horas/valores e int32 para 'dp' nos casos usuais) e 'keep' guarda um bit
+    por posição (np.packbits), para que a tabela caiba no cache da CPU.
+
+    Args:
+        horas (np.ndarray): Horas necessárias de cada colaborador ("pesos").
+        valores (np.ndarray): Valor estratégico de cada colaborador.
+        capacidade (int): Orçamento total de horas.
+
+    Returns:
+        tuple: (valor_total_maximo, lista_de_indices_selecionados)
     """
-    # 'memo' armazena os resultados já calculados (Programação Dinâmica)
-    # A chave será (n_itens_considerados, capacidade_restante)
-    memo = {}
+    n = len(horas)
 
-    # Converte o DataFrame para uma lista de dicionários para acesso mais rápido
-    # na recursão.
-    lista_colaboradores = colaboradores.to_dict('records')
+    tipo_itens = _menor_tipo_inteiro(
+        max(np.abs(horas).max(initial=0), np.abs(valores).max(initial=0)),
+        (np.int16, np.int32, np.int64),
+    )
+    horas = horas.astype(tipo_itens)
+    valores = valores.astype(tipo_itens)
 
-    n = len(lista_colaboradores)
+    # dp[c] = melhor valor obtido com no máximo 'c' horas (itens já vistos).
+    # A soma de todos os valores limita dp, então int32 basta nos casos usuais.
+    tipo_dp = _menor_tipo_inteiro(
+        np.abs(valores).sum(dtype=np.int64), (np.int32, np.int64)
+    )
+    dp = np.zeros(capacidade + 1, dtype=tipo_dp)
+    # keep[i] = bits (compactados) das posições c em que o item i entrou na
+    # melhor solução de dp[c]
+    keep = np.zeros((n, (capacidade + 8) // 8), dtype=np.uint8)
+    melhora = np.zeros(capacidade + 1, dtype=bool)
+
+    for i in range(n):
+        h = int(horas[i])
+        if h > capacidade:
+            continue
+
+        # 'incluindo' é calculado a partir da linha anterior inteira, por isso
+        # cada item é usado no máximo uma vez (mochila 0/1). A atualização é
+        # feita sem desvios (np.maximum sobre a linha toda), deslocando-a pelo
+        # peso h = horas[i].
+        incluindo = dp[:capacidade + 1 - h] + valores[i]
+        np.greater(incluindo, dp[h:], out=melhora[h:])
+        melhora[:h] = False
+        keep[i] = np.packbits(melhora)
+        np.maximum(dp[h:], incluindo, out=dp[h:])
+
+    return (
+        int(dp[capacidade]),
+        _reconstruir_selecao(keep, horas, capacidade, compactado=True),
+    )
+
+
+def _menor_tipo_inteiro(maximo, tipos):
+    """
+    Devolve o primeiro tipo de 'tipos' capaz de representar 'maximo'.
+    """
+    for tipo in tipos:
+        if maximo <= np.iinfo(tipo).max:
+            return tipo
+    return tipos[-1]
 
-    return knapsack_memo(lista_colaboradores, capacidade_total_horas, n, memo)
 
+def _reconstruir_selecao(keep, horas, capacidade, compactado=False):
+    """
+    Percorre 'keep' de trás para frente a partir de (n-1, C) e devolve os
+    índices dos itens incluídos, em ordem crescente.
 
-def knapsack_memo(colaboradores, capacidade, n, memo):
+    Com compactado=True, 'keep' está no formato de np.packbits (8 posições
+    por byte, bit mais significativo primeiro).
     """
-    Função recursiva com memorização (Top-Down DP) para o Problema da Mochila.
+    selecionados = []
+    c = capacidade
+    for i in range(len(horas) - 1, -1, -1):
+        if compactado:
+            incluido = (keep[i, c >> 3] >> (7 - (c & 7))) & 1
+        else:
+            incluido = keep[i, c]
 
-    Args:
-        colaboradores (list): Lista de dicionários dos itens.
-        capacidade (int): Horas restantes na "mochila".
-        n (int): Número de itens (colaboradores) que ainda podemos considerar.
-        memo (dict): Dicionário de memorização.
+        if incluido:
+            selecionados.append(i)
+            c -= int(horas[i])
+    selecionados.reverse()
+    return selecionados
+
+
+def _linha_dp(horas, valores, capacidade):
+    """
+    Calcula apenas a última linha da DP Bottom-Up (sem a matriz 'keep').
 
     Returns:
-        tuple: (valor_total_maximo, lista_de_nomes_selecionados)
+        np.ndarray: dp[c] = melhor valor com no máximo 'c' horas.
     """
-    # --- Casos Base ---
-    # 1. Se não há mais capacidade ou não há mais itens, o valor é 0.
-    if n == 0 or capacidade == 0:
-        return (0, [])
+    dp = np.zeros(capacidade + 1, dtype=np.int64)
+    for h, v in zip(horas, valores):
+        if h > capacidade:
+            continue
+        incluindo = dp[:capacidade + 1 - h] + v
+        np.maximum(dp[h:], incluindo, out=dp[h:])
+    return dp
 
-    # --- Memorização ---
-    # 2. Se já calculamos este subproblema (n, capacidade), retorna o resultado.
-    estado_atual = (n, capacidade)
-    if estado_atual in memo:
-        return memo[estado_atual]
-
-    # --- Decisão Recursiva ---
-    # Pega o item atual (n-1 pois os índices são base 0)
-    colaborador_atual = colaboradores[n - 1]
-    horas = colaborador_atual["Horas_Necessarias"]
-    valor = colaborador_atual["Valor_Estrategico"]
-    nome = colaborador_atual["Nome"]
-
-    # 3. Se o item atual NÃO CABE na mochila (horas > capacidade):
-    # Não temos escolha, devemos EXCLUIR o item.
-    # Passamos para o próximo item (n-1) com a MESMA capacidade.
-    if horas > capacidade:
-        resultado = knapsack_memo(colaboradores, capacidade, n - 1, memo)
 
-    else:
-        # 4. Se o item CABE, temos uma ESCOLHA:
+def knapsack_dividir_conquistar(horas, valores, capacidade):
+    """
+    DP por Divisão e Conquista (Kellerer et al.) para o Problema da Mochila.
+
+    Mesmo tempo O(N * C) da versão Bottom-Up, mas sem a matriz 'keep' de
+    N * C posições: cada nível guarda só linhas 'dp' de tamanho C + 1.
+
+    Para cada metade dos itens calcula a linha 'dp' final, escolhe como
+    dividir a capacidade entre as duas metades (c* que maximiza
+    dp_esq[c] + dp_dir[C - c]) e resolve cada metade recursivamente.
+    A profundidade da recursão é apenas log2(N).
+
+    Returns:
+        tuple: (valor_total_maximo, lista_de_indices_selecionados)
+    """
+    # Os índices escolhidos são acumulados numa única lista, em ordem, em vez
+    # de concatenar listas novas a cada nível da recursão.
+    selecionados = []
+
+    def resolver(inicio, fim, capacidade_restante):
+        # Casos base: nenhum item, nenhuma capacidade, ou um único item
+        if inicio == fim or capacidade_restante == 0:
+            return
+        if fim - inicio == 1:
+            if horas[inicio] <= capacidade_restante:
+                selecionados.append(inicio)
+            return
+
+        meio = (inicio + fim) // 2
+        dp_esq = _linha_dp(horas[inicio:meio], valores[inicio:meio],
+                           capacidade_restante)
+        dp_dir = _linha_dp(horas[meio:fim], valores[meio:fim],
+                           capacidade_restante)
+
+        # dp_dir[::-1][c] == dp_dir[capacidade_restante - c]
+        c_otimo = int(np.argmax(dp_esq + dp_dir[::-1]))
+
+        resolver(inicio, meio, c_otimo)
+        resolver(meio, fim, capacidade_restante - c_otimo)
+
+    resolver(0, len(horas), capacidade)
+
+    return (int(valores[selecionados].sum()), selecionados)
 
-        # Opção A: INCLUIR o colaborador
-        # Ganhamos 'valor' e 'gastamos' 'horas' da capacidade.
-        # Chamamos recursivamente para (n-1) e (capacidade - horas)
-        valor_incluindo, nomes_incluindo = knapsack_memo(
-            colaboradores, capacidade - horas, n - 1, memo
+
+def _knapsack_nb_py(horas, valores, capacidade):
+    """
+    Mesma recorrência de knapsack_bottom_up, escrita para ser compilada pelo
+    Numba (ver compilar_knapsack_nb).
+
+    Returns:
+        tuple: (valor_total_maximo, array_de_indices_selecionados)
+    """
+    n = horas.shape[0]
+    dp = np.zeros(capacidade + 1, dtype=np.int64)
+    keep = np.zeros((n, capacidade + 1), dtype=np.bool_)
+
+    # Capacidade da direita para a esquerda: cada item entra no máximo
+    # uma vez (mochila 0/1). Sem desvios no laço interno: a comparação vai
+    # direto para 'keep' e o max vira uma instrução de máximo/cmov,
+    # permitindo a vetorização pelo LLVM.
+    for i in range(n):
+        h = horas[i]
+        for c in range(capacidade, h - 1, -1):
+            v = dp[c - h] + valores[i]
+            keep[i, c] = v > dp[c]
+            dp[c] = max(dp[c], v)
+
+    # Reconstrução: percorre 'keep' de trás para frente a partir de (n-1, C)
+    selecionados = np.empty(n, dtype=np.int64)
+    k = 0
+    c = capacidade
+    for i in range(n - 1, -1, -1):
+        if keep[i, c]:
+            selecionados[k] = i
+            k += 1
+            c -= horas[i]
+
+    return dp[capacidade], selecionados[:k][::-1]
+
+
+@cache
+def compilar_knapsack_nb():
+    """
+    Importa o Numba e devolve _knapsack_nb_py compilada com @njit.
+
+    O import é feito só na primeira chamada (metodo="numba"), para não pesar
+    na inicialização do script quando outro método é usado. A primeira
+    execução da função compilada paga o custo de compilação; as seguintes,
+    no mesmo processo, reutilizam o código nativo. Não usamos o cache em disco
+    do Numba (cache=True): ele grava o nome do módulo que compilou a função, e
+    este script não tem um nome de módulo estável ('__main__' ao ser executado
+    diretamente, outro nome quando carregado via importlib).
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        raise ImportError("O método 'numba' requer o pacote numba instalado.") from None
+
+    return njit(_knapsack_nb_py)
+
+
+# Código C da DP Bottom-Up; a capacidade entra como constante (#define) para
+# que o compilador desenrole e vetorize o laço com limites conhecidos.
+_FONTE_KNAPSACK_C = r"""
+#define C {capacidade}
+
+void solve(int n, const int *w, const int *v, long long *dp, unsigned char *keep)
+{{
+    for (int i = 0; i < n; i++) {{
+        const int h = w[i];
+        unsigned char *linha = keep + (long long)i * (C + 1);
+        for (int c = C; c >= h; c--) {{
+            const long long x = dp[c - h] + v[i];
+            linha[c] = x > dp[c];
+            dp[c] = x > dp[c] ? x : dp[c];
+        }}
+    }}
+}}
+"""
+
+# Opções de compilação da DP gerada (fazem parte da chave do cache)
+_OPCOES_GCC = ["-O3", "-march=native", "-funroll-loops", "-shared", "-fPIC"]
+
+# Funções já carregadas nesta execução, pela chave (hash) da biblioteca
+_knapsacks_gerados = {}
+
+
+@cache
+def _diretorio_codegen():
+    """
+    Devolve o diretório privado onde ficam as bibliotecas geradas.
+
+    Em sistemas POSIX é um diretório por usuário no diretório temporário,
+    criado com permissão 0o700; se já existir, precisa pertencer ao usuário
+    atual e não dar acesso a mais ninguém, senão outro usuário poderia deixar
+    ali uma biblioteca para ser carregada. Sem os.getuid (Windows), usa um
+    diretório novo por processo (mkdtemp).
+    """
+    if not hasattr(os, "getuid"):
+        return tempfile.mkdtemp(prefix="otimizador_td-")
+
+    diretorio = os.path.join(tempfile.gettempdir(), f"otimizador_td-{os.getuid()}")
+    try:
+        os.mkdir(diretorio, 0o700)
+    except FileExistsError:
+        pass
+
+    info = os.lstat(diretorio)
+    if (not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid()
+            or info.st_mode & 0o077):
+        raise RuntimeError(
+            f"Diretório de cache do 'codegen' inseguro (dono ou permissões): {diretorio}"
         )
-        valor_incluindo += valor
-        nomes_incluindo = nomes_incluindo + [nome]  # Cria nova lista
-
-        # Opção B: EXCLUIR o colaborador
-        # Não ganhamos valor, não gastamos horas.
-        # Chamamos recursivamente para (n-1) e (capacidade)
-        valor_excluindo, nomes_excluindo = knapsack_memo(
-            colaboradores, capacidade, n - 1, memo
+    return diretorio
+
+
+def carregar_knapsack_gerado(capacidade):
+    """
+    Gera, compila e carrega (via ctypes) a DP em C especializada para a
+    capacidade informada.
+
+    O nome da biblioteca inclui um hash do código-fonte, do compilador e das
+    opções de compilação, então qualquer mudança gera uma biblioteca nova.
+    Ela fica num diretório privado do usuário e é reaproveitada entre
+    execuções; dentro do processo, a função carregada fica em cache.
+    """
+    compilador = shutil.which(os.environ.get("CC", "gcc"))
+    if compilador is None:
+        raise RuntimeError(
+            f"O método 'codegen' requer um compilador C "
+            f"({os.environ.get('CC', 'gcc')!r} não encontrado)."
         )
 
-        # Comparamos as duas opções e escolhemos a MELHOR (max)
-        if valor_incluindo > valor_excluindo:
-            resultado = (valor_incluindo, nomes_incluindo)
+    fonte = _FONTE_KNAPSACK_C.format(capacidade=capacidade)
+    chave = hashlib.sha256(
+        "\0".join([fonte, compilador, *_OPCOES_GCC]).encode()
+    ).hexdigest()[:16]
+
+    if chave in _knapsacks_gerados:
+        return _knapsacks_gerados[chave]
+
+    diretorio = _diretorio_codegen()
+    caminho_so = os.path.join(diretorio, f"knapsack_c{capacidade}_{chave}.so")
+
+    if not os.path.exists(caminho_so):
+        # Fonte e biblioteca são escritas com nomes temporários únicos; só a
+        # biblioteca pronta é renomeada (de forma atômica) para o nome final,
+        # para que outro processo nunca use arquivos pela metade.
+        descritor_c, caminho_c = tempfile.mkstemp(suffix=".c", dir=diretorio)
+        descritor_so, caminho_tmp = tempfile.mkstemp(suffix=".so.tmp", dir=diretorio)
+        os.close(descritor_so)
+        try:
+            with os.fdopen(descritor_c, "w") as arquivo:
+                arquivo.write(fonte)
+
+            resultado = subprocess.run(
+                [compilador, *_OPCOES_GCC, "-o", caminho_tmp, caminho_c],
+                capture_output=True, text=True,
+            )
+            if resultado.returncode != 0:
+                raise RuntimeError(
+                    f"Falha ao compilar o código gerado para o 'codegen':\n"
+                    f"{resultado.stderr}"
+                )
+            os.replace(caminho_tmp, caminho_so)
+        finally:
+            os.remove(caminho_c)
+            if os.path.exists(caminho_tmp):
+                os.remove(caminho_tmp)
+
+    solve = ctypes.CDLL(caminho_so).solve
+    solve.restype = None
+    solve.argtypes = [
+        ctypes.c_int,
+        np.ctypeslib.ndpointer(np.int32, flags="C_CONTIGUOUS"),
+        np.ctypeslib.ndpointer(np.int32, flags="C_CONTIGUOUS"),
+        np.ctypeslib.ndpointer(np.int64, flags="C_CONTIGUOUS"),
+        np.ctypeslib.ndpointer(np.uint8, flags="C_CONTIGUOUS"),
+    ]
+
+    _knapsacks_gerados[chave] = solve
+    return solve
+
+
+def knapsack_codegen(horas, valores, capacidade):
+    """
+    Mesma recorrência de knapsack_bottom_up, executada pelo código C gerado
+    por carregar_knapsack_gerado para esta capacidade.
+
+    Returns:
+        tuple: (valor_total_maximo, lista_de_indices_selecionados)
+    """
+    solve = carregar_knapsack_gerado(capacidade)
+
+    n = len(horas)
+    dp = np.zeros(capacidade + 1, dtype=np.int64)
+    keep = np.zeros((n, capacidade + 1), dtype=np.uint8)
+
+    solve(n, horas.astype(np.int32), valores.astype(np.int32), dp, keep)
+
+    return (int(dp[capacidade]), _reconstruir_selecao(keep, horas, capacidade))
+
+
+def knapsack_memo(horas, valores, capacidade, memo):
+    """
+    Função recursiva com memorização (Top-Down DP) para o Problema da Mochila.
+
+    A recursão desce um nível por item, então a profundidade é N. O script não
+    altera o limite de recursão global do Python (sys.setrecursionlimit); para
+    milhares de colaboradores use as versões Bottom-Up ou Divisão e Conquista.
+
+    Args:
+        horas (tuple): Horas necessárias de cada colaborador ("pesos").
+        valores (tuple): Valor estratégico de cada colaborador.
+        capacidade (int): Orçamento total de horas.
+        memo (np.ndarray): Tabela (n + 1) x (capacidade + 1) iniciada com -1.
+
+    Returns:
+        tuple: (valor_total_maximo, lista_de_indices_selecionados)
+    """
+    # --- Memorização ---
+    # A tabela 'memo' guarda o resultado de cada subproblema
+    # (n, capacidade_restante), acessado por índice em vez de hash de tupla.
+    # Só o valor (um int) é memorizado; a lista de selecionados é reconstruída
+    # no final, sem criar novas listas a cada chamada.
+    # memo.item devolve um int Python (e não um escalar np.int64), mantendo a
+    # aritmética da recursão em inteiros nativos.
+    ler_memo = memo.item
+
+    def melhor_valor(n, capacidade_restante):
+        # --- Casos Base ---
+        # 1. Se não há mais capacidade ou não há mais itens, o valor é 0.
+        if n == 0 or capacidade_restante == 0:
+            return 0
+
+        # Se já calculamos este subproblema, retorna o resultado.
+        resultado = ler_memo(n, capacidade_restante)
+        if resultado >= 0:
+            return resultado
+
+        # --- Decisão Recursiva ---
+        # Pega o item atual (n-1 pois os índices são base 0)
+        horas_item = horas[n - 1]
+
+        # 2. Se o item atual NÃO CABE na mochila (horas > capacidade):
+        # Não temos escolha, devemos EXCLUIR o item.
+        if horas_item > capacidade_restante:
+            resultado = melhor_valor(n - 1, capacidade_restante)
+
         else:
-            resultado = (valor_excluindo, nomes_excluindo)
+            # 3. Se o item CABE, escolhemos a MELHOR (max) entre:
+            # Opção A: INCLUIR o colaborador (ganha 'valor', gasta 'horas')
+            valor_incluindo = (
+                melhor_valor(n - 1, capacidade_restante - horas_item)
+                + valores[n - 1]
+            )
+            # Opção B: EXCLUIR o colaborador (mantém a capacidade)
+            valor_excluindo = melhor_valor(n - 1, capacidade_restante)
+
+            resultado = max(valor_incluindo, valor_excluindo)
+
+        # 4. Antes de retornar, ARMAZENAMOS o resultado no 'memo'.
+        memo[n, capacidade_restante] = resultado
+        return resultado
+
+    n = len(horas)
+    valor_max = melhor_valor(n, capacidade)
 
-    # 5. Antes de retornar, ARMAZENAMOS o resultado no 'memo'.
-    memo[estado_atual] = resultado
-    return resultado
+    # --- Backtracking ---
+    # Se o valor muda ao retirar o item n-1, então ele foi incluído.
+    selecionados = []
+    capacidade_restante = capacidade
+    for i in range(n, 0, -1):
+        if melhor_valor(i, capacidade_restante) != melhor_valor(i - 1, capacidade_restante):
+            selecionados.append(i - 1)
+            capacidade_restante -= horas[i - 1]
+    selecionados.reverse()
+
+    return (valor_max, selecionados)
 
 
 # --- Estrutura de Saída (Relatório) ---
 
+def imprimir_tabela(df, colunas):
+    """
+    Imprime as colunas indicadas do DataFrame, separadas por tabulação.
+
+    As linhas são montadas direto das tuplas (itertuples) e impressas de uma
+    só vez, sem o alinhamento célula a célula feito por DataFrame.to_string.
+    """
+    linhas = ["\t".join(colunas)]
+    linhas.extend(
+        "\t".join(map(str, linha))
+        for linha in df[colunas].itertuples(index=False, name=None)
+    )
+    print("\n".join(linhas))
+
+
 def apresentar_relatorio(df_original, capacidade, resultado_dp):
     """
     Imprime um relatório formatado dos resultados da otimização.
@@ -180,9 +705,9 @@ def apresentar_relatorio(df_original, capacidade, resultado_dp):
     valor_max, nomes_selecionados = resultado_dp
 
     # Filtra o DataFrame original para mostrar os detalhes dos selecionados
-    df_selecionados = df_original[df_original["Nome"].isin(nomes_selecionados)]
+    df_selecionados = df_original[df_original["Nome"].isin(set(nomes_selecionados))]
 
-    horas_gastas = df_selecionados["Horas_Necessarias"].sum()
+    horas_gastas = df_selecionados["Horas_Necessarias"].to_numpy().sum()
 
     print("=" * 70)
     print("    RELATÓRIO DE OTIMIZAÇÃO DE REQUALIFICAÇÃO (T&D) - A.R.C.")
@@ -198,7 +723,7 @@ def apresentar_relatorio(df_original, capacidade, resultado_dp):
 
     # Define a ordem das colunas para o relatório
     colunas_relatorio = ["Nome", "Horas_Necessarias", "Valor_Estrategico"]
-    print(df_selecionados[colunas_relatorio].to_string(index=False))
+    imprimir_tabela(df_selecionados, colunas_relatorio)
     print("=" * 70)
 
 
@@ -214,15 +739,16 @@ if __name__ == "__main__":
     df_colaboradores = criar_dataframe(dados)
 
     print("\n--- (Entrada) Lista Completa de Colaboradores (Primeiros 10) ---")
-    print(df_colaboradores.head(10).to_string(index=False))
+    imprimir_tabela(df_colaboradores.head(10), list(df_colaboradores.columns))
     print("...")
 
     # 3. ORDENAÇÃO: Aplicar Merge Sort (como solicitado)
     # Vamos ordenar por "Valor_Estrategico" para fins de visualização
-    df_ordenado = merge_sort(df_colaboradores, "Valor_Estrategico")
+    df_ordenado = ordenar_dataframe(df_colaboradores, "Valor_Estrategico")
 
     print("\n--- (Ordenação) Lista Ordenada por Valor Estratégico (Maiores) ---")
-    print(df_ordenado.tail(5).to_string(index=False))  # Mostra os 5 maiores valores
+    # Mostra os 5 maiores valores
+    imprimir_tabela(df_ordenado.tail(5), list(df_ordenado.columns))
 
     # 4. PROCESSAMENTO: Rodar a solução de DP
     # Nota: A DP não precisa que os dados estejam pré-ordenados.
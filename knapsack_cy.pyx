@@ -0,0 +1,57 @@
+# cython: language_level=3
+"""
+Versão compilada (Cython) da DP Bottom-Up para o Problema da Mochila.
+
+Compilar com:
+    python setup.py build_ext --inplace
+"""
+import numpy as np
+
+cimport cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef tuple knapsack(int[::1] horas, int[::1] valores, int capacidade):
+    """
+    Mesma recorrência de knapsack_bottom_up, em laços C tipados.
+
+    Args:
+        horas (np.ndarray[int32]): Horas necessárias de cada colaborador.
+        valores (np.ndarray[int32]): Valor estratégico de cada colaborador.
+        capacidade (int): Orçamento total de horas.
+
+    Returns:
+        tuple: (valor_total_maximo, lista_de_indices_selecionados)
+    """
+    cdef Py_ssize_t n = horas.shape[0]
+    cdef Py_ssize_t i, c, h
+    cdef long long v
+
+    dp_array = np.zeros(capacidade + 1, dtype=np.int64)
+    keep_array = np.zeros((n, capacidade + 1), dtype=np.uint8)
+    cdef long long[::1] dp = dp_array
+    cdef unsigned char[:, ::1] keep = keep_array
+
+    # Percorre a capacidade da direita para a esquerda para que cada item
+    # seja usado no máximo uma vez (mochila 0/1). O laço interno não tem
+    # desvios: a comparação vai direto para 'keep' e o max é traduzido pelo
+    # Cython para uma expressão C simples (cmov), que o compilador pode
+    # vetorizar.
+    for i in range(n):
+        h = horas[i]
+        for c in range(capacidade, h - 1, -1):
+            v = dp[c - h] + valores[i]
+            keep[i, c] = v > dp[c]
+            dp[c] = max(dp[c], v)
+
+    # Reconstrução: percorre 'keep' de trás para frente a partir de (n-1, C)
+    selecionados = []
+    c = capacidade
+    for i in range(n - 1, -1, -1):
+        if keep[i, c]:
+            selecionados.append(i)
+            c -= horas[i]
+    selecionados.reverse()
+
+    return (dp[capacidade], selecionados)
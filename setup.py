@@ -0,0 +1,23 @@
+"""
+Compila a extensão Cython opcional usada por
+otimizar_alocacao_formacao(..., metodo="cython").
+
+Uso:
+    python setup.py build_ext --inplace
+"""
+import numpy as np
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+extensoes = [
+    Extension(
+        "knapsack_cy",
+        ["knapsack_cy.pyx"],
+        include_dirs=[np.get_include()],
+    ),
+]
+
+setup(
+    name="knapsack_cy",
+    ext_modules=cythonize(extensoes, language_level=3),
+)